@@ -4,8 +4,9 @@ import enum
 from datetime import datetime, date
 from typing import List, Dict, Optional, Union
 from collections import defaultdict
+from functools import cached_property
 
-from sqlalchemy import create_engine, Column, Integer, String, Float, Date, Enum, Text, Boolean, ForeignKey, Table
+from sqlalchemy import create_engine, event, Column, Integer, String, Float, Date, Enum, Text, Boolean, ForeignKey, Table
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 
@@ -270,15 +271,30 @@ class SavingsGoal(BaseModel):
         if self.current_amount >= self.target_amount:
             self.is_achieved = True
     
-    def get_progress_percentage(self) -> float:
-        """Calculate progress as percentage."""
+    @cached_property
+    def progress_percentage(self) -> float:
+        """Progress as percentage, cached until the amounts change."""
         if self.target_amount <= 0:
             return 0.0
         return min((self.current_amount / self.target_amount) * 100, 100.0)
     
+    @cached_property
+    def remaining_amount(self) -> float:
+        """Remaining amount to reach goal, cached until the amounts change."""
+        return max(self.target_amount - self.current_amount, 0.0)
+    
+    def clear_cached_amounts(self):
+        """Drop cached progress values so they are recalculated on next use."""
+        self.__dict__.pop('progress_percentage', None)
+        self.__dict__.pop('remaining_amount', None)
+    
+    def get_progress_percentage(self) -> float:
+        """Calculate progress as percentage."""
+        return self.progress_percentage
+    
     def get_remaining_amount(self) -> float:
         """Calculate remaining amount to reach goal."""
-        return max(self.target_amount - self.current_amount, 0.0)
+        return self.remaining_amount
     
     def __repr__(self):
         return (f"<SavingsGoal(id={self.id}, name='{self.name}', "
@@ -301,6 +317,25 @@ class SavingsGoal(BaseModel):
         }
 
 
+# Any change to the goal amounts, including reloads from the database, clears the cache
+@event.listens_for(SavingsGoal.current_amount, 'set')
+@event.listens_for(SavingsGoal.target_amount, 'set')
+def _savings_goal_amount_set(target, value, oldvalue, initiator):
+    target.clear_cached_amounts()
+
+
+@event.listens_for(SavingsGoal, 'expire')
+def _savings_goal_expired(target, attrs):
+    # Expiry can run after the instance itself has been garbage collected
+    if target is not None:
+        target.clear_cached_amounts()
+
+
+@event.listens_for(SavingsGoal, 'refresh')
+def _savings_goal_refreshed(target, context, attrs):
+    target.clear_cached_amounts()
+
+
 from contextlib import contextmanager
 
 @contextmanager
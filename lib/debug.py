@@ -1,21 +1,32 @@
 """Debug utilities for the finance tracker application."""
 
+import atexit
+import functools
+import itertools
 import logging
+import queue
 import sys
+import time
 from datetime import datetime
 from typing import Dict, List, Any
 from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener
 
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.pretty import pprint
+from sqlalchemy import delete, event, exists, select, func
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from db.models import get_db_session, User, Transaction, Budget, SavingsGoal, Tag, UserProfile
+from db.models import (
+    get_db_session, User, Transaction, Budget, SavingsGoal, Tag, UserProfile, TransactionType,
+    transaction_tags
+)
 
 
 class DebugLogger:
@@ -25,6 +36,8 @@ class DebugLogger:
         self.console = Console()
         self.logger = logging.getLogger('finance_tracker')
         self.logger.setLevel(log_level)
+        self.log_queue = None
+        self.listener = None
         
         # Create console handler
         handler = logging.StreamHandler(sys.stdout)
@@ -36,15 +49,34 @@ class DebugLogger:
         )
         handler.setFormatter(formatter)
         
-        # Add handler to logger if not already added
+        # Add handler to logger if not already added. Records are only queued
+        # by the caller; a background listener writes them to stdout.
         if not self.logger.handlers:
-            self.logger.addHandler(handler)
+            self.log_queue = queue.Queue(-1)
+            self.logger.addHandler(QueueHandler(self.log_queue))
+            
+            self.listener = QueueListener(self.log_queue, handler, respect_handler_level=True)
+            self.listener.start()
+            atexit.register(self.listener.stop)
+    
+    def flush(self):
+        """Block until every queued log record has been written."""
+        if self.log_queue is not None:
+            self.log_queue.join()
+    
+    def _print(self, renderable):
+        """Print Rich output after the queued records, keeping stdout in order."""
+        self.flush()
+        self.console.print(renderable)
     
     def log_transaction(self, transaction_data: Dict):
         """Log transaction creation/update."""
-        self.logger.info(f"Transaction operation: {transaction_data}")
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         
-        self.console.print(Panel(
+        self.logger.info("Transaction operation: %s", transaction_data)
+        
+        self._print(Panel(
             f"[bold cyan]Transaction Debug[/bold cyan]\n"
             f"Amount: ${transaction_data.get('amount', 'N/A')}\n"
             f"Type: {transaction_data.get('transaction_type', 'N/A')}\n"
@@ -56,7 +88,10 @@ class DebugLogger:
     
     def log_budget_status(self, budget_data: Dict):
         """Log budget analysis."""
-        self.logger.info(f"Budget analysis: {budget_data}")
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
+        self.logger.info("Budget analysis: %s", budget_data)
         
         spent = budget_data.get('spent', 0)
         limit = budget_data.get('limit_amount', 0)
@@ -64,7 +99,7 @@ class DebugLogger:
         
         status_color = "green" if remaining >= 0 else "red"
         
-        self.console.print(Panel(
+        self._print(Panel(
             f"[bold yellow]Budget Debug[/bold yellow]\n"
             f"Category: {budget_data.get('category', 'N/A')}\n"
             f"Limit: ${limit}\n"
@@ -76,17 +111,21 @@ class DebugLogger:
     
     def log_database_query(self, query_type: str, table: str, filters: Dict = None):
         """Log database operations."""
-        filters = filters or {}
-        self.logger.debug(f"DB Query - Type: {query_type}, Table: {table}, Filters: {filters}")
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         
-        if self.logger.level <= logging.DEBUG:
-            self.console.print(f"[dim]DB: {query_type} on {table} with {filters}[/dim]")
+        filters = filters or {}
+        self.logger.debug("DB Query - Type: %s, Table: %s, Filters: %s", query_type, table, filters)
+        self._print(f"[dim]DB: {query_type} on {table} with {filters}[/dim]")
     
     def log_validation_error(self, field: str, value: Any, error: str):
         """Log validation failures."""
-        self.logger.warning(f"Validation failed - Field: {field}, Value: {value}, Error: {error}")
+        if not self.logger.isEnabledFor(logging.WARNING):
+            return
+        
+        self.logger.warning("Validation failed - Field: %s, Value: %s, Error: %s", field, value, error)
         
-        self.console.print(Panel(
+        self._print(Panel(
             f"[bold red]Validation Error[/bold red]\n"
             f"Field: {field}\n"
             f"Value: {value}\n"
@@ -97,9 +136,11 @@ class DebugLogger:
     
     def log_user_session(self, user_id: int, action: str):
         """Log user session activities."""
-        self.logger.info(f"User {user_id} performed action: {action}")
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         
-        self.console.print(f"[dim cyan]User {user_id}: {action}[/dim cyan]")
+        self.logger.info("User %s performed action: %s", user_id, action)
+        self._print(f"[dim cyan]User {user_id}: {action}[/dim cyan]")
 
 
 # Global debug logger instance
@@ -109,55 +150,138 @@ debug_logger = DebugLogger()
 @contextmanager
 def debug_database_operation(operation_name: str):
     """Context manager for debugging database operations."""
-    start_time = datetime.now()
-    debug_logger.logger.debug(f"Starting database operation: {operation_name}")
+    start_time = time.perf_counter()
+    debug_logger.logger.debug("Starting database operation: %s", operation_name)
     
     try:
         yield
-        end_time = datetime.now()
-        duration = (end_time - start_time).total_seconds()
-        debug_logger.logger.debug(f"Completed {operation_name} in {duration:.3f} seconds")
+        duration = time.perf_counter() - start_time
+        debug_logger.logger.debug("Completed %s in %.3f seconds", operation_name, duration)
     except Exception as e:
-        debug_logger.logger.error(f"Database operation {operation_name} failed: {str(e)}")
+        debug_logger.logger.error("Database operation %s failed: %s", operation_name, e)
         raise
 
 
+# Tables reported by the database statistics, keyed by their stats name
+STATS_MODELS = {
+    "users": User,
+    "transactions": Transaction,
+    "budgets": Budget,
+    "savings_goals": SavingsGoal,
+    "tags": Tag,
+    "profiles": UserProfile
+}
+
+
+def get_table_counts(session) -> Dict[str, int]:
+    """Count the rows of every stats table in a single query."""
+    row = session.execute(select(*[
+        select(func.count()).select_from(model).scalar_subquery().label(name)
+        for name, model in STATS_MODELS.items()
+    ])).one()
+    return dict(row._mapping)
+
+
+# Bumped when a session that wrote to a stats table ends its transaction;
+# cached aggregations are keyed on it
+_stats_generation = 0
+
+# Seconds before cached statistics are recomputed anyway, so writes made by
+# other processes (the CLI, seed.py) are picked up
+STATS_CACHE_TTL = 30
+
+# Session.info flag recording writes that have not been committed or rolled back yet
+_STATS_WRITE_FLAG = "stats_tables_written"
+
+
+def invalidate_stats_cache():
+    """Force cached statistics to be recomputed on their next use."""
+    global _stats_generation
+    _stats_generation += 1
+
+
+@event.listens_for(Session, "after_flush")
+def _on_flush(session, flush_context):
+    stats_classes = tuple(STATS_MODELS.values())
+    changed = itertools.chain(session.new, session.dirty, session.deleted)
+    if any(isinstance(obj, stats_classes) for obj in changed):
+        session.info[_STATS_WRITE_FLAG] = True
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _on_transaction_end(session):
+    # Counts read while the writes were pending may have been cached, so drop
+    # them once the outcome is known
+    if session.info.pop(_STATS_WRITE_FLAG, False):
+        invalidate_stats_cache()
+
+
+def cached_until_write(func):
+    """Cache a read-only aggregation until a stats table is written.
+    
+    The cache is invalidated when an ORM session in this process commits or
+    rolls back flushed writes. Bulk statements skip the flush, so their
+    callers set the session's write flag themselves; call
+    invalidate_stats_cache() after raw SQL. Changes from other processes are
+    seen once the cached value is STATS_CACHE_TTL seconds old at most.
+    """
+    cached = functools.lru_cache(maxsize=1)(lambda generation, period: func())
+    
+    @functools.wraps(func)
+    def wrapper():
+        return cached(_stats_generation, int(time.monotonic() // STATS_CACHE_TTL))
+    
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
+@cached_until_write
+def load_database_stats() -> Dict[str, Any]:
+    """Load table counts and the income/expense breakdown."""
+    with get_db_session() as session:
+        counts = get_table_counts(session)
+        type_counts = dict(
+            session.query(Transaction.transaction_type, func.count())
+            .group_by(Transaction.transaction_type).all()
+        )
+    
+    return {
+        "counts": counts,
+        "income_transactions": type_counts.get(TransactionType.INCOME, 0),
+        "expense_transactions": type_counts.get(TransactionType.EXPENSE, 0)
+    }
+
+
 def print_database_stats():
     """Print comprehensive database statistics."""
     console = Console()
     
     try:
-        with get_db_session() as session:
-            # Count records in each table
-            user_count = session.query(User).count()
-            transaction_count = session.query(Transaction).count()
-            budget_count = session.query(Budget).count()
-            savings_goal_count = session.query(SavingsGoal).count()
-            tag_count = session.query(Tag).count()
-            profile_count = session.query(UserProfile).count()
-            
-            # Create stats table
-            table = Table(title="Database Statistics", show_header=True, header_style="bold magenta")
-            table.add_column("Table", style="cyan", width=20)
-            table.add_column("Count", style="green", justify="right")
-            
-            table.add_row("Users", str(user_count))
-            table.add_row("Transactions", str(transaction_count))
-            table.add_row("Budgets", str(budget_count))
-            table.add_row("Savings Goals", str(savings_goal_count))
-            table.add_row("Tags", str(tag_count))
-            table.add_row("User Profiles", str(profile_count))
-            
-            console.print(table)
-            
-            # Additional stats
-            if transaction_count > 0:
-                total_income = session.query(Transaction).filter_by(transaction_type='income').count()
-                total_expenses = session.query(Transaction).filter_by(transaction_type='expense').count()
-                
-                console.print(f"\n[cyan]Transaction Breakdown:[/cyan]")
-                console.print(f"Income transactions: {total_income}")
-                console.print(f"Expense transactions: {total_expenses}")
+        # Count records in each table
+        stats = load_database_stats()
+        counts = stats["counts"]
+        transaction_count = counts["transactions"]
+        
+        # Create stats table
+        table = Table(title="Database Statistics", show_header=True, header_style="bold magenta")
+        table.add_column("Table", style="cyan", width=20)
+        table.add_column("Count", style="green", justify="right")
+        
+        table.add_row("Users", str(counts["users"]))
+        table.add_row("Transactions", str(transaction_count))
+        table.add_row("Budgets", str(counts["budgets"]))
+        table.add_row("Savings Goals", str(counts["savings_goals"]))
+        table.add_row("Tags", str(counts["tags"]))
+        table.add_row("User Profiles", str(counts["profiles"]))
+        
+        console.print(table)
+        
+        # Additional stats
+        if transaction_count > 0:
+            console.print(f"\n[cyan]Transaction Breakdown:[/cyan]")
+            console.print(f"Income transactions: {stats['income_transactions']}")
+            console.print(f"Expense transactions: {stats['expense_transactions']}")
     
     except Exception as e:
         console.print(f"[red]Error getting database stats: {str(e)}[/red]")
@@ -169,7 +293,9 @@ def print_user_debug_info(user_id: int):
     
     try:
         with get_db_session() as session:
-            user = session.query(User).filter_by(id=user_id).first()
+            user = session.query(User).options(
+                joinedload(User.profile)
+            ).filter_by(id=user_id).first()
             
             if not user:
                 console.print(f"[red]User {user_id} not found[/red]")
@@ -188,7 +314,7 @@ def print_user_debug_info(user_id: int):
             ))
             
             # Profile info
-            profile = session.query(UserProfile).filter_by(user_id=user_id).first()
+            profile = user.profile
             if profile:
                 console.print(Panel(
                     f"[bold green]Profile Information[/bold green]\n"
@@ -200,14 +326,20 @@ def print_user_debug_info(user_id: int):
                     border_style="green"
                 ))
             
-            # Transaction summary
-            transactions = session.query(Transaction).filter_by(user_id=user_id).all()
-            total_income = sum(t.amount for t in transactions if t.transaction_type.value == 'income')
-            total_expenses = sum(t.amount for t in transactions if t.transaction_type.value == 'expense')
+            # Transaction summary, aggregated in the database
+            rows = session.execute(
+                select(Transaction.transaction_type, func.sum(Transaction.amount), func.count())
+                .where(Transaction.user_id == user_id)
+                .group_by(Transaction.transaction_type)
+            ).all()
+            totals = {tt.value: (amount, count) for tt, amount, count in rows}
+            total_income = totals.get('income', (0, 0))[0]
+            total_expenses = totals.get('expense', (0, 0))[0]
+            transaction_count = sum(count for _, count in totals.values())
             
             console.print(Panel(
                 f"[bold yellow]Financial Summary[/bold yellow]\n"
-                f"Total Transactions: {len(transactions)}\n"
+                f"Total Transactions: {transaction_count}\n"
                 f"Total Income: ${total_income:.2f}\n"
                 f"Total Expenses: ${total_expenses:.2f}\n"
                 f"Net Amount: ${total_income - total_expenses:.2f}",
@@ -240,104 +372,145 @@ def print_user_debug_info(user_id: int):
         console.print(f"[red]Error getting user debug info: {str(e)}[/red]")
 
 
+def _orphan_count(model):
+    """Scalar subquery counting rows of model whose user no longer exists."""
+    return (
+        select(func.count(model.id))
+        .select_from(model)
+        .outerjoin(User, model.user_id == User.id)
+        .where(User.id.is_(None))
+        .scalar_subquery()
+    )
+
+
+@cached_until_write
+def load_integrity_counts() -> Dict[str, int]:
+    """Count orphaned rows and invalid transaction amounts in a single query."""
+    with get_db_session() as session:
+        row = session.execute(select(
+            _orphan_count(Transaction).label("orphaned_transactions"),
+            _orphan_count(Budget).label("orphaned_budgets"),
+            _orphan_count(SavingsGoal).label("orphaned_goals"),
+            _orphan_count(UserProfile).label("orphaned_profiles"),
+            select(func.count()).select_from(Transaction)
+            .where(Transaction.amount <= 0)
+            .scalar_subquery().label("invalid_amounts")
+        )).one()
+        return dict(row._mapping)
+
+
 def validate_database_integrity():
     """Validate database integrity and relationships."""
     console = Console()
     issues = []
     
     try:
-        with get_db_session() as session:
-            console.print("[cyan]Checking database integrity...[/cyan]")
-            
-            # Check for orphaned transactions
-            orphaned_transactions = session.query(Transaction).filter(
-                ~Transaction.user_id.in_(session.query(User.id))
-            ).count()
-            
-            if orphaned_transactions > 0:
-                issues.append(f"Found {orphaned_transactions} orphaned transactions")
-            
-            # Check for orphaned budgets
-            orphaned_budgets = session.query(Budget).filter(
-                ~Budget.user_id.in_(session.query(User.id))
-            ).count()
-            
-            if orphaned_budgets > 0:
-                issues.append(f"Found {orphaned_budgets} orphaned budgets")
-            
-            # Check for orphaned savings goals
-            orphaned_goals = session.query(SavingsGoal).filter(
-                ~SavingsGoal.user_id.in_(session.query(User.id))
-            ).count()
-            
-            if orphaned_goals > 0:
-                issues.append(f"Found {orphaned_goals} orphaned savings goals")
-            
-            # Check for orphaned profiles
-            orphaned_profiles = session.query(UserProfile).filter(
-                ~UserProfile.user_id.in_(session.query(User.id))
-            ).count()
-            
-            if orphaned_profiles > 0:
-                issues.append(f"Found {orphaned_profiles} orphaned user profiles")
-            
-            # Check for invalid transaction amounts
-            invalid_amounts = session.query(Transaction).filter(
-                Transaction.amount <= 0
-            ).count()
-            
-            if invalid_amounts > 0:
-                issues.append(f"Found {invalid_amounts} transactions with invalid amounts")
-            
-            # Report results
-            if issues:
-                console.print(Panel(
-                    "\n".join([f"⚠️ {issue}" for issue in issues]),
-                    title="Database Integrity Issues",
-                    border_style="red"
-                ))
-            else:
-                console.print("[green]✓ Database integrity check passed![/green]")
+        console.print("[cyan]Checking database integrity...[/cyan]")
+        
+        counts = load_integrity_counts()
+        
+        # Check for orphaned transactions
+        if counts["orphaned_transactions"] > 0:
+            issues.append(f"Found {counts['orphaned_transactions']} orphaned transactions")
+        
+        # Check for orphaned budgets
+        if counts["orphaned_budgets"] > 0:
+            issues.append(f"Found {counts['orphaned_budgets']} orphaned budgets")
+        
+        # Check for orphaned savings goals
+        if counts["orphaned_goals"] > 0:
+            issues.append(f"Found {counts['orphaned_goals']} orphaned savings goals")
+        
+        # Check for orphaned profiles
+        if counts["orphaned_profiles"] > 0:
+            issues.append(f"Found {counts['orphaned_profiles']} orphaned user profiles")
+        
+        # Check for invalid transaction amounts
+        if counts["invalid_amounts"] > 0:
+            issues.append(f"Found {counts['invalid_amounts']} transactions with invalid amounts")
+        
+        # Report results
+        if issues:
+            console.print(Panel(
+                "\n".join([f"⚠️ {issue}" for issue in issues]),
+                title="Database Integrity Issues",
+                border_style="red"
+            ))
+        else:
+            console.print("[green]✓ Database integrity check passed![/green]")
     
     except Exception as e:
         console.print(f"[red]Error during integrity check: {str(e)}[/red]")
 
 
+def delete_orphaned_records(session: Session) -> Dict[str, int]:
+    """Delete rows whose user no longer exists, with one bulk DELETE per table.
+    
+    The deletes run in the given session and are committed with it.
+    """
+    def orphaned(model):
+        return ~exists().where(User.id == model.user_id)
+    
+    orphaned_transaction_ids = select(Transaction.id).where(orphaned(Transaction))
+    deleted = {}
+    
+    # Tag links first, since SQLite does not enforce the cascade by default
+    session.execute(
+        delete(transaction_tags)
+        .where(transaction_tags.c.transaction_id.in_(orphaned_transaction_ids))
+    )
+    
+    for name, model in (("transactions", Transaction), ("budgets", Budget),
+                        ("savings_goals", SavingsGoal), ("profiles", UserProfile)):
+        result = session.execute(
+            delete(model).where(orphaned(model)),
+            # Deleted rows may be loaded in the caller's session; drop them from it
+            execution_options={"synchronize_session": "fetch"}
+        )
+        deleted[name] = result.rowcount
+    
+    # Bulk deletes skip the flush, so flag the write for the stats cache here
+    session.info[_STATS_WRITE_FLAG] = True
+    return deleted
+
+
+# Number of users hydrated per batch while streaming an export
+EXPORT_BATCH_SIZE = 100
+
+
 def export_debug_data(user_id: int = None, filename: str = None):
-    """Export debug data to a file."""
+    """Export debug data to a file, streaming users in batches."""
     import json
-    from datetime import date
     
     if not filename:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"debug_data_{timestamp}.json"
     
-    debug_data = {
-        "export_timestamp": datetime.now().isoformat(),
-        "database_stats": {},
-        "users": [],
-        "integrity_issues": []
-    }
+    def dump(value, indent: str = "  ") -> str:
+        # Same layout json.dump(indent=2) gives a value nested at this depth
+        return json.dumps(value, indent=2, default=str).replace("\n", "\n" + indent)
+    
+    partial_filename = filename + ".partial"
     
     try:
-        with get_db_session() as session:
-            # Database stats
-            debug_data["database_stats"] = {
-                "users": session.query(User).count(),
-                "transactions": session.query(Transaction).count(),
-                "budgets": session.query(Budget).count(),
-                "savings_goals": session.query(SavingsGoal).count(),
-                "tags": session.query(Tag).count(),
-                "profiles": session.query(UserProfile).count()
-            }
+        with get_db_session() as session, open(partial_filename, 'w') as f:
+            f.write("{\n")
+            f.write(f'  "export_timestamp": {dump(datetime.now().isoformat())},\n')
+            f.write(f'  "database_stats": {dump(load_database_stats()["counts"])},\n')
+            f.write('  "users": [')
             
-            # User data
+            # User data, with related rows loaded per batch instead of per user
+            query = session.query(User).options(
+                selectinload(User.transactions).selectinload(Transaction.tags),
+                selectinload(User.budgets),
+                selectinload(User.savings_goals),
+                selectinload(User.profile)
+            )
             if user_id:
-                users = session.query(User).filter_by(id=user_id).all()
-            else:
-                users = session.query(User).all()
+                query = query.filter_by(id=user_id)
             
-            for user in users:
+            user_count = 0
+            for user in query.yield_per(EXPORT_BATCH_SIZE):
                 user_data = user.to_dict()
                 
                 # Add related data
@@ -348,26 +521,31 @@ def export_debug_data(user_id: int = None, filename: str = None):
                 if user.profile:
                     user_data["profile"] = user.profile.to_dict()
                 
-                debug_data["users"].append(user_data)
+                f.write(",\n    " if user_count else "\n    ")
+                f.write(dump(user_data, "    "))
+                user_count += 1
+            
+            f.write("\n  ]" if user_count else "]")
+            f.write(',\n  "integrity_issues": []\n}')
         
-        # Save to file
-        with open(filename, 'w') as f:
-            json.dump(debug_data, f, indent=2, default=str)
+        os.replace(partial_filename, filename)
         
         console = Console()
         console.print(f"[green]Debug data exported to {filename}[/green]")
     
     except Exception as e:
+        if os.path.exists(partial_filename):
+            os.remove(partial_filename)
         console = Console()
         console.print(f"[red]Error exporting debug data: {str(e)}[/red]")
 
 
 def benchmark_database_operations():
     """Benchmark common database operations."""
-    import time
     from rich.progress import Progress, TimeElapsedColumn, BarColumn, TextColumn
     
     console = Console()
+    iterations = 10  # Run each operation 10 times
     
     operations = [
         ("User Query", lambda s: s.query(User).all()),
@@ -389,33 +567,41 @@ def benchmark_database_operations():
         for name, operation in operations:
             task = progress.add_task(f"Benchmarking {name}", total=100)
             
-            times = []
-            for i in range(10):  # Run each operation 10 times
-                try:
-                    with get_db_session() as session:
-                        start_time = time.time()
+            # Running stats over successful runs, in nanoseconds
+            total_ns = 0
+            min_ns = max_ns = None
+            successes = 0
+            
+            # One session per operation so only the query itself is timed
+            with get_db_session() as session:
+                for i in range(iterations):
+                    try:
+                        start_ns = time.perf_counter_ns()
                         operation(session)
-                        end_time = time.time()
-                        times.append(end_time - start_time)
-                except Exception as e:
-                    times.append(None)
-                    console.print(f"[red]Error in {name}: {str(e)}[/red]")
-                
-                progress.update(task, advance=10)
+                        elapsed_ns = time.perf_counter_ns() - start_ns
+                    except Exception as e:
+                        session.rollback()
+                        console.print(f"[red]Error in {name}: {str(e)}[/red]")
+                    else:
+                        total_ns += elapsed_ns
+                        successes += 1
+                        if min_ns is None or elapsed_ns < min_ns:
+                            min_ns = elapsed_ns
+                        if max_ns is None or elapsed_ns > max_ns:
+                            max_ns = elapsed_ns
+                    
+                    # Start each run with an empty identity map
+                    session.expunge_all()
+                    progress.update(task, advance=10)
             
             # Calculate stats
-            valid_times = [t for t in times if t is not None]
-            if valid_times:
-                avg_time = sum(valid_times) / len(valid_times)
-                min_time = min(valid_times)
-                max_time = max(valid_times)
-                
+            if successes:
                 results.append({
                     "operation": name,
-                    "avg_time": avg_time,
-                    "min_time": min_time,
-                    "max_time": max_time,
-                    "success_rate": len(valid_times) / len(times)
+                    "avg_time": total_ns / successes / 1e9,
+                    "min_time": min_ns / 1e9,
+                    "max_time": max_ns / 1e9,
+                    "success_rate": successes / iterations
                 })
     
     # Display results
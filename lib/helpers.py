@@ -1,20 +1,79 @@
 """Helper functions for the finance tracker application."""
 
 import re
+import string
 from datetime import datetime, date
-from typing import Tuple, Union
+from typing import Any, Tuple, Union
+
+# Precompiled patterns used by the validators below
+_AMOUNT_CLEAN_RE = re.compile(r'[$,€£]')
+_CATEGORY_BAD_RE = re.compile(r'[<>"\']')
+_NAME_RE = re.compile(r"^[a-zA-Z\s\-'\.]+$")
+_NAME_ONLY_SPECIAL_RE = re.compile(r'^[\s\-\'\.]+$')
+_DESC_BAD_RE = re.compile(r'[<>]')
+_PHONE_STRIP_RE = re.compile(r'[\s\-\(\)\+]')
+
+# Character classes for the structural email/hex/tag checks
+_EMAIL_LOCAL_CHARS = frozenset(string.ascii_letters + string.digits + '._%+-')
+_EMAIL_DOMAIN_CHARS = frozenset(string.ascii_letters + string.digits + '.-')
+_HEX_DIGITS = frozenset(string.hexdigits)
+_TAG_CHARS = frozenset(string.ascii_lowercase + string.digits + '-_')
+
+# Display templates for currencies with a dedicated symbol
+_CURRENCY_FORMATS = {
+    "USD": "${:,.2f}",
+    "EUR": "€{:,.2f}",
+    "GBP": "£{:,.2f}"
+}
+
+# Accepted date input formats and the allowed date range
+_DATE_FORMATS = ('%Y-%m-%d', '%Y/%m/%d', '%d-%m-%Y', '%d/%m/%Y')
+_MIN_DATE = date(1900, 1, 1)
+_MAX_DATE = date(2100, 12, 31)
+
+# Suffixes used by format_large_number, largest threshold first
+_LARGE_NUMBER_SUFFIXES = (
+    (1_000_000_000, "B"),
+    (1_000_000, "M"),
+    (1_000, "K")
+)
+
+# Category keywords and their emoji; earlier keys win when several match
+_CATEGORY_EMOJI = {
+    'food': '🍔',
+    'groceries': '🛒',
+    'transport': '🚗',
+    'gas': '⛽',
+    'rent': '🏠',
+    'utilities': '💡',
+    'entertainment': '🎬',
+    'shopping': '🛍️',
+    'health': '🏥',
+    'education': '📚',
+    'salary': '💰',
+    'bonus': '🎉',
+    'investment': '📈',
+    'savings': '🏦',
+    'insurance': '🛡️',
+    'travel': '✈️',
+    'gym': '💪',
+    'subscription': '📺',
+    'coffee': '☕',
+    'restaurant': '🍽️'
+}
+_CATEGORY_RANK = {key: rank for rank, key in enumerate(_CATEGORY_EMOJI)}
+# Zero-width lookahead so overlapping keywords are all found in one scan
+_CATEGORY_EMOJI_RE = re.compile(
+    '(?=(' + '|'.join(map(re.escape, _CATEGORY_EMOJI)) + '))'
+)
 
 
 def format_currency(amount: float, currency: str = "USD") -> str:
     """Format amount as currency string."""
-    if currency == "USD":
-        return f"${amount:,.2f}"
-    elif currency == "EUR":
-        return f"€{amount:,.2f}"
-    elif currency == "GBP":
-        return f"£{amount:,.2f}"
-    else:
-        return f"{currency} {amount:,.2f}"
+    template = _CURRENCY_FORMATS.get(currency)
+    if template:
+        return template.format(amount)
+    return f"{currency} {amount:,.2f}"
 
 
 def format_date(date_obj: date) -> str:
@@ -33,7 +92,7 @@ def validate_amount(amount_str: str) -> Tuple[bool, Union[float, str]]:
     """Validate and convert amount string to float."""
     try:
         # Remove currency symbols and commas
-        cleaned = re.sub(r'[$,€£]', '', str(amount_str).strip())
+        cleaned = _AMOUNT_CLEAN_RE.sub('', str(amount_str).strip())
         amount = float(cleaned)
         
         if amount < 0:
@@ -57,10 +116,13 @@ def validate_email(email: str) -> Tuple[bool, Union[str, str]]:
     if len(email) > 255:
         return False, "Email is too long"
     
-    # Basic email regex pattern
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    
-    if not re.match(pattern, email):
+    # Basic structure: local@domain.tld
+    local, at, domain = email.partition('@')
+    host, dot, tld = domain.rpartition('.')
+    if (not at or not local or not host or not dot
+            or len(tld) < 2 or not (tld.isascii() and tld.isalpha())
+            or not _EMAIL_LOCAL_CHARS.issuperset(local)
+            or not _EMAIL_DOMAIN_CHARS.issuperset(host)):
         return False, "Invalid email format"
     
     return True, email.lower()
@@ -77,7 +139,7 @@ def validate_category(category: str) -> Tuple[bool, Union[str, str]]:
         return False, "Category name is too long (max 100 characters)"
     
     # Check for invalid characters
-    if re.search(r'[<>"\']', category):
+    if _CATEGORY_BAD_RE.search(category):
         return False, "Category contains invalid characters"
     
     return True, category.title()  # Capitalize first letter of each word
@@ -89,29 +151,34 @@ def validate_date(date_str: str) -> Tuple[bool, Union[date, str]]:
         if not date_str:
             return False, "Date cannot be empty"
         
-        # Try different date formats
-        formats = ['%Y-%m-%d', '%Y/%m/%d', '%d-%m-%Y', '%d/%m/%Y']
+        parsed_date = None
         
-        for fmt in formats:
+        # Fast path for zero-padded ISO dates (YYYY-MM-DD)
+        if len(date_str) == 10 and date_str[4] == date_str[7] == '-':
             try:
-                parsed_date = datetime.strptime(date_str, fmt).date()
-                
-                # Check if date is reasonable (not too far in past or future)
-                today = date.today()
-                min_date = date(1900, 1, 1)
-                max_date = date(2100, 12, 31)
-                
-                if parsed_date < min_date:
-                    return False, "Date is too far in the past"
-                
-                if parsed_date > max_date:
-                    return False, "Date is too far in the future"
-                
-                return True, parsed_date
+                parsed_date = date.fromisoformat(date_str)
             except ValueError:
-                continue
+                pass
+        
+        # Try different date formats
+        if parsed_date is None:
+            for fmt in _DATE_FORMATS:
+                try:
+                    parsed_date = datetime.strptime(date_str, fmt).date()
+                    break
+                except ValueError:
+                    continue
+            else:
+                return False, "Invalid date format. Use YYYY-MM-DD"
+        
+        # Check if date is reasonable (not too far in past or future)
+        if parsed_date < _MIN_DATE:
+            return False, "Date is too far in the past"
+        
+        if parsed_date > _MAX_DATE:
+            return False, "Date is too far in the future"
         
-        return False, "Invalid date format. Use YYYY-MM-DD"
+        return True, parsed_date
         
     except Exception:
         return False, "Invalid date format"
@@ -124,7 +191,8 @@ def validate_month(month_str: str) -> Tuple[bool, Union[str, str]]:
             return False, "Month cannot be empty"
         
         # Check format YYYY-MM
-        if not re.match(r'^\d{4}-\d{2}$', month_str):
+        if not (len(month_str) == 7 and month_str[4] == '-' and month_str.isascii()
+                and month_str[:4].isdigit() and month_str[5:].isdigit()):
             return False, "Invalid month format. Use YYYY-MM (e.g., 2023-12)"
         
         year, month = month_str.split('-')
@@ -157,11 +225,11 @@ def validate_name(name: str) -> Tuple[bool, Union[str, str]]:
         return False, "Name is too long (max 100 characters)"
     
     # Check for invalid characters (allow letters, spaces, hyphens, apostrophes)
-    if not re.match(r"^[a-zA-Z\s\-'\.]+$", name):
+    if not _NAME_RE.match(name):
         return False, "Name contains invalid characters"
     
     # Check for reasonable structure
-    if re.match(r'^[\s\-\'\.]+$', name):  # Only special characters
+    if _NAME_ONLY_SPECIAL_RE.match(name):  # Only special characters
         return False, "Name must contain letters"
     
     return True, name.title()  # Capitalize properly
@@ -179,7 +247,7 @@ def validate_description(description: str) -> Tuple[bool, Union[str, str]]:
         return False, "Description is too long (max 255 characters)"
     
     # Check for potentially harmful content
-    if re.search(r'[<>]', description):
+    if _DESC_BAD_RE.search(description):
         return False, "Description contains invalid characters"
     
     return True, description
@@ -230,6 +298,26 @@ def get_budget_status(spent: float, limit: float) -> Tuple[str, str]:
         return "Over", "red"
 
 
+def get_budget_status_bulk(spent, limit) -> Tuple[Any, Any]:
+    """Vectorised get_budget_status returning arrays of statuses and colors."""
+    import numpy as np
+    
+    spent = np.asarray(spent, dtype=float)
+    limit = np.asarray(limit, dtype=float)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        percentage = (spent / limit) * 100
+    
+    index = np.select(
+        [limit <= 0, percentage <= 50, percentage <= 75, percentage <= 100],
+        [0, 1, 2, 3],
+        default=4
+    )
+    statuses = np.array(["No limit", "Good", "Warning", "High", "Over"])
+    colors = np.array(["gray", "green", "yellow", "orange", "red"])
+    return statuses[index], colors[index]
+
+
 def get_savings_progress_color(percentage: float) -> str:
     """Get color for savings progress based on percentage."""
     if percentage >= 100:
@@ -242,24 +330,31 @@ def get_savings_progress_color(percentage: float) -> str:
         return "red"
 
 
+def get_savings_progress_color_bulk(percentage) -> Any:
+    """Vectorised get_savings_progress_color returning an array of colors."""
+    import numpy as np
+    
+    percentage = np.asarray(percentage, dtype=float)
+    return np.select(
+        [percentage >= 100, percentage >= 75, percentage >= 50],
+        ["green", "yellow", "blue"],
+        default="red"
+    )
+
+
 def parse_tag_string(tags_str: str) -> list:
     """Parse comma-separated tag string into list."""
     if not tags_str:
         return []
     
     # Split by comma and clean up
-    tags = [tag.strip().lower() for tag in tags_str.split(',')]
-    
-    # Remove empty tags and duplicates
-    tags = list(set(tag for tag in tags if tag))
+    tags = (tag.strip() for tag in tags_str.lower().split(','))
     
-    # Validate each tag
-    valid_tags = []
-    for tag in tags:
-        if len(tag) <= 50 and re.match(r'^[a-zA-Z0-9\-_]+$', tag):
-            valid_tags.append(tag)
-    
-    return valid_tags
+    # Keep valid tags once each, in the order they were given
+    return list(dict.fromkeys(
+        tag for tag in tags
+        if tag and len(tag) <= 50 and _TAG_CHARS.issuperset(tag)
+    ))
 
 
 def calculate_emergency_fund_target(monthly_expenses: float, months: int = 6) -> float:
@@ -323,48 +418,60 @@ def get_financial_health_score(income: float, expenses: float, savings: float,
     return score, description
 
 
+def get_financial_health_score_bulk(income, expenses, savings, debt=0) -> Tuple[Any, Any]:
+    """Vectorised get_financial_health_score returning arrays of scores and descriptions."""
+    import numpy as np
+    
+    income = np.asarray(income, dtype=float)
+    expenses = np.asarray(expenses, dtype=float)
+    savings = np.asarray(savings, dtype=float)
+    debt = np.asarray(debt, dtype=float)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        savings_rate = (savings / income) * 100
+        expense_ratio = (expenses / income) * 100
+        debt_ratio = (debt / income) * 100
+    
+    score = (
+        100
+        - np.select([expense_ratio > 80, expense_ratio > 60, expense_ratio > 50], [30, 20, 10], default=0)
+        - np.select([debt_ratio > 40, debt_ratio > 20, debt_ratio > 10], [25, 15, 5], default=0)
+        + np.select([savings_rate >= 20, savings_rate >= 10], [10, 5], default=0)
+    )
+    score = np.clip(score, 0, 100)
+    
+    description = np.select(
+        [score >= 80, score >= 60, score >= 40, score >= 20],
+        ["Excellent", "Good", "Fair", "Poor"],
+        default="Critical"
+    )
+    
+    has_income = income > 0
+    score = np.where(has_income, score, 0)
+    description = np.where(has_income, description, "No income data")
+    return score, description
+
+
 def format_large_number(number: float) -> str:
     """Format large numbers with appropriate suffixes."""
-    if number >= 1_000_000_000:
-        return f"{number/1_000_000_000:.1f}B"
-    elif number >= 1_000_000:
-        return f"{number/1_000_000:.1f}M"
-    elif number >= 1_000:
-        return f"{number/1_000:.1f}K"
-    else:
+    # Most amounts are below a thousand, so check that first
+    if number < 1_000:
         return f"{number:.2f}"
+    
+    for threshold, suffix in _LARGE_NUMBER_SUFFIXES:
+        if number >= threshold:
+            return f"{number/threshold:.1f}{suffix}"
+    
+    return f"{number:.2f}"
 
 
 def get_transaction_category_emoji(category: str) -> str:
     """Get emoji for transaction category."""
-    category_lower = category.lower()
-    
-    emoji_map = {
-        'food': '🍔',
-        'groceries': '🛒',
-        'transport': '🚗',
-        'gas': '⛽',
-        'rent': '🏠',
-        'utilities': '💡',
-        'entertainment': '🎬',
-        'shopping': '🛍️',
-        'health': '🏥',
-        'education': '📚',
-        'salary': '💰',
-        'bonus': '🎉',
-        'investment': '📈',
-        'savings': '🏦',
-        'insurance': '🛡️',
-        'travel': '✈️',
-        'gym': '💪',
-        'subscription': '📺',
-        'coffee': '☕',
-        'restaurant': '🍽️'
-    }
-    
-    for key, emoji in emoji_map.items():
-        if key in category_lower:
-            return emoji
+    found = {m.group(1) for m in _CATEGORY_EMOJI_RE.finditer(category.lower())}
+    
+    # Earlier keys in the map take precedence when several match
+    if found:
+        return _CATEGORY_EMOJI[min(found, key=_CATEGORY_RANK.__getitem__)]
     
     return '📋'  # Default emoji
 
@@ -377,7 +484,7 @@ def validate_phone_number(phone: str) -> Tuple[bool, Union[str, str]]:
     phone = phone.strip()
     
     # Remove common separators
-    cleaned = re.sub(r'[\s\-\(\)\+]', '', phone)
+    cleaned = _PHONE_STRIP_RE.sub('', phone)
     
     # Check if it contains only digits
     if not cleaned.isdigit():
@@ -402,7 +509,7 @@ def validate_hex_color(color: str) -> Tuple[bool, Union[str, str]]:
         color = '#' + color
     
     # Check format
-    if not re.match(r'^#[0-9A-Fa-f]{6}$', color):
+    if len(color) != 7 or not _HEX_DIGITS.issuperset(color[1:]):
         return False, "Invalid color format. Use hex format like #FF0000"
     
     return True, color.lower()
@@ -413,7 +520,4 @@ def truncate_text(text: str, max_length: int = 50) -> str:
     if not text:
         return ""
     
-    if len(text) <= max_length:
-        return text
-    
-    return text[:max_length - 3] + "..."
\ No newline at end of file
+    return text if len(text) <= max_length else text[:max_length - 3] + "..."
\ No newline at end of file
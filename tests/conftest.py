@@ -0,0 +1,62 @@
+"""Shared fixtures for the finance tracker tests."""
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from lib.db.models import Base, SavingsGoal
+
+
+@pytest.fixture(scope="session")
+def engine():
+    """In-memory SQLite engine with the schema created once per test run."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    
+    # Let SQLAlchemy issue BEGIN itself so SAVEPOINT rollbacks work with pysqlite
+    @event.listens_for(engine, "connect")
+    def disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+    
+    @event.listens_for(engine, "begin")
+    def emit_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+    
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db_session(engine):
+    """Session whose changes are rolled back after each test."""
+    connection = engine.connect()
+    transaction = connection.begin()
+    Session = sessionmaker(bind=connection, join_transaction_mode="create_savepoint")
+    session = Session()
+    
+    yield session
+    
+    session.close()
+    transaction.rollback()
+    connection.close()
+
+
+def _vacation_goal():
+    return SavingsGoal(name="Vacation", target_amount=2000.0, current_amount=500.0, user_id=1)
+
+
+@pytest.fixture(scope="module")
+def sample_goal():
+    """Shared savings goal for tests that only read from it."""
+    return _vacation_goal()
+
+
+@pytest.fixture
+def fresh_goal():
+    """Savings goal built per test, for tests that mutate it."""
+    return _vacation_goal()
@@ -0,0 +1,223 @@
+"""Tests for debug utilities."""
+
+import io
+import json
+import os
+import sys
+from contextlib import contextmanager
+
+import pytest
+from rich.console import Console
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+# debug.py imports its models as db.models, so it needs lib/ on the path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "lib"))
+
+import debug
+
+
+
+def test_debug_logger_keeps_records_and_panels_in_order(monkeypatch):
+    """Test each log record is written before the panel that follows it."""
+    logger = debug.debug_logger
+    stream = io.StringIO()
+    handler = logger.listener.handlers[0]
+    monkeypatch.setattr(logger, "console", Console(file=stream, width=80))
+    
+    original = handler.setStream(stream)
+    try:
+        for amount in (10, 20, 30):
+            logger.log_transaction({"amount": amount})
+        logger.flush()
+    finally:
+        handler.setStream(original)
+    
+    expected = []
+    for amount in (10, 20, 30):
+        expected += [f"Transaction operation: {{'amount': {amount}}}", f"Amount: ${amount}"]
+    
+    lines = [line for line in stream.getvalue().splitlines()
+             if "Transaction operation" in line or "Amount:" in line]
+    assert len(lines) == len(expected)
+    assert all(text in line for text, line in zip(expected, lines))
+
+@pytest.fixture
+def stats_session(tmp_path, monkeypatch):
+    """Session factory for a file database that the debug helpers also read from.
+    
+    A file database is used so the helpers read over their own connection and
+    only see committed rows, as they do against the real database.
+    """
+    engine = create_engine(f"sqlite:///{tmp_path / 'stats.db'}")
+    debug.User.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    
+    @contextmanager
+    def get_db_session():
+        session = Session()
+        try:
+            yield session
+            session.commit()
+        finally:
+            session.close()
+    
+    monkeypatch.setattr(debug, "get_db_session", get_db_session)
+    debug.invalidate_stats_cache()
+    yield Session
+    engine.dispose()
+
+
+def test_stats_cache_refreshed_after_commit(stats_session):
+    """Test counts cached between a flush and its commit are not kept."""
+    session = stats_session()
+    session.add(debug.Tag(name="groceries"))
+    session.flush()
+    
+    assert debug.load_database_stats()["counts"]["tags"] == 0
+    
+    session.commit()
+    assert debug.load_database_stats()["counts"]["tags"] == 1
+    session.close()
+
+
+def test_stats_cache_refreshed_after_orphan_cleanup(stats_session):
+    """Test the bulk orphan deletes invalidate the cached counts once committed."""
+    session = stats_session()
+    session.add(debug.Budget(category="Rent", limit_amount=900.0, month="2023-12", user_id=999))
+    session.commit()
+    assert debug.load_database_stats()["counts"]["budgets"] == 1
+    
+    debug.delete_orphaned_records(session)
+    session.commit()
+    assert debug.load_database_stats()["counts"]["budgets"] == 0
+    session.close()
+
+
+def test_stats_cache_reused_without_writes(stats_session):
+    """Test repeated reads without writes are served from the cache."""
+    first = debug.load_database_stats()
+    
+    assert debug.load_database_stats() is first
+
+
+
+def test_stats_cache_expires_after_ttl(stats_session, monkeypatch):
+    """Test writes the session events cannot see are picked up after the TTL."""
+    now = 1000 * debug.STATS_CACHE_TTL
+    monkeypatch.setattr(debug.time, "monotonic", lambda: now)
+    assert debug.load_database_stats()["counts"]["tags"] == 0
+    
+    # Raw SQL stands in for a write made by another process
+    session = stats_session()
+    session.connection().exec_driver_sql("INSERT INTO tags (name) VALUES ('external')")
+    session.commit()
+    session.close()
+    assert debug.load_database_stats()["counts"]["tags"] == 0
+    
+    now += debug.STATS_CACHE_TTL
+    assert debug.load_database_stats()["counts"]["tags"] == 1
+
+
+def test_delete_orphaned_records(db_session):
+    """Test only rows without a user are deleted, tag links included."""
+    user = debug.User(name="Owner", email="owner@example.com")
+    tag = debug.Tag(name="orphan-check")
+    db_session.add_all([user, tag])
+    db_session.flush()
+    
+    def transaction(user_id):
+        return debug.Transaction(
+            amount=10.0, description="Coffee", category="Food",
+            transaction_type=debug.TransactionType.EXPENSE, user_id=user_id, tags=[tag]
+        )
+    
+    kept = transaction(user.id)
+    orphaned_budget = debug.Budget(category="Rent", limit_amount=900.0, month="2023-12", user_id=999)
+    db_session.add_all([
+        kept, transaction(999), transaction(999), orphaned_budget,
+        debug.Budget(category="Food", limit_amount=100.0, month="2023-12", user_id=user.id),
+        debug.SavingsGoal(name="Car", target_amount=5000.0, user_id=999),
+        debug.UserProfile(user_id=999),
+    ])
+    db_session.flush()
+    
+    deleted = debug.delete_orphaned_records(db_session)
+    
+    assert deleted == {"transactions": 2, "budgets": 1, "savings_goals": 1, "profiles": 1}
+    assert debug.get_table_counts(db_session) == {
+        "users": 1, "profiles": 0, "transactions": 1, "budgets": 1, "savings_goals": 0, "tags": 1
+    }
+    links = db_session.execute(select(debug.transaction_tags.c.transaction_id)).scalars().all()
+    assert links == [kept.id]
+    
+    # Deleted rows already loaded in the session must not be written back
+    assert orphaned_budget not in db_session
+    orphaned_budget.limit_amount = 1000.0
+    db_session.flush()
+
+
+@pytest.fixture
+def export_users(stats_session):
+    """Seed users with every kind of related row; the last one has none."""
+    session = stats_session()
+    food, travel = debug.Tag(name="food"), debug.Tag(name="travel")
+    
+    for i in range(3):
+        session.add(debug.User(
+            name=f"User {i}", email=f"user{i}@example.com", monthly_income=1000.0 * i,
+            transactions=[
+                debug.Transaction(amount=12.5 * (n + 1), description=f"Purchase {n}", category="Food",
+                                  transaction_type=debug.TransactionType.EXPENSE, tags=[food, travel][:n + 1])
+                for n in range(2 - i)
+            ],
+            budgets=[debug.Budget(category="Food", limit_amount=300.0, month="2023-12")] if i < 2 else [],
+            savings_goals=[debug.SavingsGoal(name="Trip", target_amount=800.0, current_amount=100.0)] if i < 2 else [],
+            profile=debug.UserProfile(occupation="Engineer") if i == 0 else None
+        ))
+    session.commit()
+    session.close()
+
+
+def _expected_export(session, user_id, timestamp):
+    """Build the export the way json.dump of the whole document lays it out."""
+    query = session.query(debug.User)
+    if user_id:
+        query = query.filter_by(id=user_id)
+    
+    users = []
+    for user in query:
+        user_data = user.to_dict()
+        user_data["transactions"] = [t.to_dict() for t in user.transactions]
+        user_data["budgets"] = [b.to_dict() for b in user.budgets]
+        user_data["savings_goals"] = [g.to_dict() for g in user.savings_goals]
+        if user.profile:
+            user_data["profile"] = user.profile.to_dict()
+        users.append(user_data)
+    
+    return {
+        "export_timestamp": timestamp,
+        "database_stats": debug.get_table_counts(session),
+        "users": users,
+        "integrity_issues": []
+    }
+
+
+@pytest.mark.parametrize("user_id,user_count", [(None, 3), (1, 1), (999, 0)],
+                         ids=["all", "one-match", "no-match"])
+def test_export_debug_data_matches_json_dump(stats_session, export_users, tmp_path, user_id, user_count):
+    """Test the streamed export is byte-for-byte what json.dump would write."""
+    filename = tmp_path / "export.json"
+    
+    debug.export_debug_data(user_id=user_id, filename=str(filename))
+    
+    content = filename.read_text()
+    timestamp = json.loads(content)["export_timestamp"]
+    session = stats_session()
+    expected = json.dumps(_expected_export(session, user_id, timestamp), indent=2, default=str)
+    session.close()
+    
+    assert content == expected
+    assert len(json.loads(content)["users"]) == user_count
+    assert not os.path.exists(str(filename) + ".partial")
+
@@ -0,0 +1,144 @@
+"""Tests for helper functions."""
+
+import itertools
+
+import pytest
+from datetime import date
+from lib.helpers import (
+    validate_email, validate_month, validate_hex_color, validate_date, parse_tag_string,
+    get_budget_status, get_budget_status_bulk,
+    get_savings_progress_color, get_savings_progress_color_bulk,
+    get_financial_health_score, get_financial_health_score_bulk
+)
+
+
+@pytest.mark.parametrize("email,expected", [
+    ("john@example.com", "john@example.com"),
+    ("  John.Doe+tag@Mail.Example.ORG ", "john.doe+tag@mail.example.org"),
+    ("a_b%c-d@sub-domain.co", "a_b%c-d@sub-domain.co"),
+])
+def test_validate_email_accepts(email, expected):
+    """Test valid email addresses are accepted and lowercased."""
+    assert validate_email(email) == (True, expected)
+
+
+@pytest.mark.parametrize("email", [
+    "john.example.com", "@example.com", "john@", "john@example", "john@.com",
+    "john@example.c", "john@example.c0m", "jo hn@example.com", "john@@example.com",
+    "jöhn@example.com", "john@exämple.com", "john@example.cöm",
+])
+def test_validate_email_rejects(email):
+    """Test malformed email addresses are rejected."""
+    assert validate_email(email) == (False, "Invalid email format")
+
+
+@pytest.mark.parametrize("month", ["2023-12", "1900-01", "2100-12"])
+def test_validate_month_accepts(month):
+    """Test YYYY-MM months in range are accepted."""
+    assert validate_month(month) == (True, month)
+
+
+@pytest.mark.parametrize("month", [
+    "2023/12", "2023-1", "23-12", "2023-123", "20a3-12",
+    "2023-12\n", "٢٠٢٣-12", "２０２３-12",
+])
+def test_validate_month_rejects_format(month):
+    """Test badly formed months, including non-ASCII digits, are rejected."""
+    assert validate_month(month) == (False, "Invalid month format. Use YYYY-MM (e.g., 2023-12)")
+
+
+@pytest.mark.parametrize("month,error", [
+    ("1899-12", "Year must be between 1900 and 2100"),
+    ("2023-00", "Month must be between 01 and 12"),
+    ("2023-13", "Month must be between 01 and 12"),
+])
+def test_validate_month_rejects_range(month, error):
+    """Test months outside the allowed range are rejected."""
+    assert validate_month(month) == (False, error)
+
+
+@pytest.mark.parametrize("color,expected", [
+    ("#FF0000", "#ff0000"),
+    ("00aaBB", "#00aabb"),
+    ("", "#007bff"),
+])
+def test_validate_hex_color_accepts(color, expected):
+    """Test hex colors are normalised, with a default for empty input."""
+    assert validate_hex_color(color) == (True, expected)
+
+
+@pytest.mark.parametrize("color", ["#FF00", "#FF00000", "#GG0000", "##FF000", "#１２３４５６"])
+def test_validate_hex_color_rejects(color):
+    """Test invalid hex colors are rejected."""
+    assert validate_hex_color(color) == (False, "Invalid color format. Use hex format like #FF0000")
+
+
+@pytest.mark.parametrize("date_str,expected", [
+    ("2023-01-05", date(2023, 1, 5)),
+    ("2023-1-5", date(2023, 1, 5)),
+    ("2023/01/05", date(2023, 1, 5)),
+    ("05-01-2023", date(2023, 1, 5)),
+    ("05/01/2023", date(2023, 1, 5)),
+])
+def test_validate_date_accepts(date_str, expected):
+    """Test supported date formats are parsed."""
+    assert validate_date(date_str) == (True, expected)
+
+
+@pytest.mark.parametrize("date_str,error", [
+    ("", "Date cannot be empty"),
+    ("20230105", "Invalid date format. Use YYYY-MM-DD"),
+    ("2023-02-30", "Invalid date format. Use YYYY-MM-DD"),
+    ("2023-01-05T00:00", "Invalid date format. Use YYYY-MM-DD"),
+    ("1899-12-31", "Date is too far in the past"),
+    ("2101-01-01", "Date is too far in the future"),
+])
+def test_validate_date_rejects(date_str, error):
+    """Test unsupported or out-of-range dates are rejected."""
+    assert validate_date(date_str) == (False, error)
+
+
+def test_parse_tag_string_keeps_first_seen_order():
+    """Test tags are normalised, de-duplicated and kept in input order."""
+    assert parse_tag_string("Work, home,work , ,Travel,HOME") == ["work", "home", "travel"]
+
+
+def test_parse_tag_string_drops_invalid_tags():
+    """Test tags with invalid characters or over 50 characters are dropped."""
+    tags = "ok-tag,bad tag,bad!,snake_case," + "x" * 51 + "," + "y" * 50
+    assert parse_tag_string(tags) == ["ok-tag", "snake_case", "y" * 50]
+
+
+def test_parse_tag_string_empty():
+    """Test empty input gives no tags."""
+    assert parse_tag_string("") == []
+
+
+# Values on and around every threshold used by the scalar helpers
+AMOUNTS = [-10.0, 0.0, 5.0, 10.0, 20.0, 40.0, 50.0, 60.0, 75.0, 80.0, 100.0, 150.0]
+INCOMES = [-100.0, 0.0, 100.0, 250.0]
+
+
+def _columns(rows):
+    return [list(column) for column in zip(*rows)]
+
+
+BULK_CASES = [
+    (get_budget_status, get_budget_status_bulk,
+     list(itertools.product(AMOUNTS, [-1.0, 0.0, 50.0, 100.0]))),
+    (get_savings_progress_color, get_savings_progress_color_bulk,
+     [(percentage,) for percentage in AMOUNTS + [49.9, 74.9, 99.9]]),
+    (get_financial_health_score, get_financial_health_score_bulk,
+     list(itertools.product(INCOMES, AMOUNTS, AMOUNTS, [0.0, 10.5, 25.0, 45.0]))),
+]
+
+
+@pytest.mark.parametrize("scalar,bulk,rows", BULK_CASES, ids=["budget", "savings", "health"])
+def test_bulk_helpers_match_scalar(scalar, bulk, rows):
+    """Test each vectorised helper agrees with its scalar version row by row."""
+    pytest.importorskip("numpy")
+    
+    result = bulk(*_columns(rows))
+    actual = list(zip(*result)) if isinstance(result, tuple) else list(result)
+    
+    assert actual == [scalar(*row) for row in rows]
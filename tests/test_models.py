@@ -1,93 +1,104 @@
 """Tests for database models."""
 
 import pytest
+from pytest import approx
 from datetime import date
-from finance_tracker.models import User, Transaction, Budget, SavingsGoal, TransactionType
+from lib.db.models import User, Transaction, Budget, SavingsGoal, TransactionType
 
 
-def test_user_creation():
-    """Test User model creation."""
-    user = User(
-        name="John Doe",
-        email="john@example.com",
-        default_currency="USD",
-        monthly_income=5000.0
-    )
-    
-    assert user.name == "John Doe"
-    assert user.email == "john@example.com"
-    assert user.default_currency == "USD"
-    assert user.monthly_income == 5000.0
-
-
-def test_transaction_creation():
-    """Test Transaction model creation."""
-    transaction = Transaction(
-        amount=100.50,
-        description="Grocery shopping",
-        category="Food",
-        transaction_type=TransactionType.EXPENSE,
-        transaction_date=date.today(),
-        user_id=1
-    )
-    
-    assert transaction.amount == 100.50
-    assert transaction.description == "Grocery shopping"
-    assert transaction.category == "Food"
-    assert transaction.transaction_type == TransactionType.EXPENSE
-    assert transaction.user_id == 1
-
-
-def test_budget_creation():
-    """Test Budget model creation."""
-    budget = Budget(
-        category="Food",
-        limit_amount=500.0,
-        month="2025-01",
-        user_id=1
-    )
+TODAY = date.today()
+EXPENSE = TransactionType.EXPENSE
+
+TRANSACTION_KWARGS = dict(
+    amount=100.50,
+    description="Grocery shopping",
+    category="Food",
+    transaction_type=EXPENSE,
+    user_id=1
+)
+
+CASES = [
+    (
+        User,
+        dict(name="John Doe", email="john@example.com", default_currency="USD", monthly_income=5000.0),
+        {"name": "John Doe", "email": "john@example.com", "default_currency": "USD", "monthly_income": 5000.0}
+    ),
+    (
+        Transaction,
+        dict(transaction_date=TODAY, **TRANSACTION_KWARGS),
+        TRANSACTION_KWARGS
+    ),
+    (
+        Budget,
+        dict(category="Food", limit_amount=500.0, month="2025-01", user_id=1),
+        {"category": "Food", "limit_amount": 500.0, "month": "2025-01", "user_id": 1}
+    ),
+    (
+        SavingsGoal,
+        dict(name="Emergency Fund", target_amount=10000.0, current_amount=2500.0, user_id=1),
+        {"name": "Emergency Fund", "target_amount": 10000.0, "current_amount": 2500.0, "user_id": 1}
+    ),
+]
+
+
+@pytest.mark.parametrize("cls,kwargs,expected", CASES, ids=["user", "transaction", "budget", "goal"])
+def test_model_creation(cls, kwargs, expected):
+    """Test model creation sets the given attributes."""
+    obj = cls(**kwargs)
     
-    assert budget.category == "Food"
-    assert budget.limit_amount == 500.0
-    assert budget.month == "2025-01"
-    assert budget.user_id == 1
-
-
-def test_savings_goal_creation():
-    """Test SavingsGoal model creation."""
-    goal = SavingsGoal(
-        name="Emergency Fund",
-        target_amount=10000.0,
-        current_amount=2500.0,
-        user_id=1
-    )
+    actual = {attr: getattr(obj, attr) for attr in expected}
+    assert actual == expected
+
+
+def test_progress_percentage(sample_goal):
+    """Test SavingsGoal progress percentage."""
+    assert sample_goal.get_progress_percentage() == approx(25.0)
+
+
+def test_remaining_amount(sample_goal):
+    """Test SavingsGoal remaining amount."""
+    assert sample_goal.get_remaining_amount() == approx(1500.0)
+
+
+def test_add_contribution(fresh_goal):
+    """Test SavingsGoal contribution."""
+    fresh_goal.add_contribution(300.0)
     
-    assert goal.name == "Emergency Fund"
-    assert goal.target_amount == 10000.0
-    assert goal.current_amount == 2500.0
-    assert goal.user_id == 1
-
-
-def test_savings_goal_methods():
-    """Test SavingsGoal calculation methods."""
-    goal = SavingsGoal(
-        name="Vacation",
-        target_amount=2000.0,
-        current_amount=500.0,
-        user_id=1
-    )
+    assert fresh_goal.current_amount == approx(800.0)
+    assert not fresh_goal.is_achieved
+
+
+def test_is_achieved_when_target_reached(fresh_goal):
+    """Test SavingsGoal is achieved once contributions reach the target."""
+    fresh_goal.add_contribution(300.0)
+    fresh_goal.add_contribution(1200.0)
     
-    # Test progress percentage
-    assert goal.get_progress_percentage() == 25.0
+    assert fresh_goal.is_achieved is True
+
+
+def test_user_relationships_persist(db_session):
+    """Test a user's related records are saved and loaded back."""
+    user = User(name="Jane Doe", email="jane@example.com")
+    user.savings_goals.append(SavingsGoal(name="Car", target_amount=8000.0))
+    user.budgets.append(Budget(category="Food", limit_amount=400.0, month="2025-02"))
+    db_session.add(user)
+    db_session.commit()
     
-    # Test remaining amount
-    assert goal.get_remaining_amount() == 1500.0
+    loaded = db_session.query(User).filter_by(email="jane@example.com").one()
+    assert loaded.default_currency == "USD"
+    assert [g.name for g in loaded.savings_goals] == ["Car"]
+    assert loaded.savings_goals[0].current_amount == 0.0
+    assert [b.category for b in loaded.budgets] == ["Food"]
+
+
+def test_progress_recalculated_after_change(fresh_goal):
+    """Test cached SavingsGoal progress follows contributions and target changes."""
+    assert fresh_goal.get_progress_percentage() == approx(25.0)
     
-    # Test contribution
-    result = goal.add_contribution(300.0)
-    assert result is True
-    assert goal.current_amount == 800.0
+    fresh_goal.add_contribution(500.0)
+    assert fresh_goal.get_progress_percentage() == approx(50.0)
+    assert fresh_goal.get_remaining_amount() == approx(1000.0)
     
-    # Test achievement
-    goal.add_contribution(1200.0)
-    assert goal.is_achieved is True
\ No newline at end of file
+    fresh_goal.target_amount = 4000.0
+    assert fresh_goal.get_progress_percentage() == approx(25.0)
+    assert fresh_goal.get_remaining_amount() == approx(3000.0)